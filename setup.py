@@ -17,6 +17,7 @@ setup(
     keywords=['scientific', 'mathematical transforms'],
     include_package_data=True,
     install_requires=['numpy', 'scipy', 'matplotlib'],
+    extras_require={'numba': ['numba']},
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
@@ -17,6 +17,8 @@ class Domain:
     def get(self):
         if self._dom is None:
             self._dom = self.create()
+            # The grid is shared by every function defined on this domain, hence it must not be modified
+            self._dom.setflags(write=False)
 
         return self._dom
 
@@ -203,7 +205,7 @@ class Domain:
 
     @classmethod
     def from_array(cls, values):
-        values = numpy.array(values)
+        values = numpy.asarray(values)
         return Domain(values.min(), values.max(), len(values))
 
     @classmethod
@@ -1,17 +1,32 @@
+import bisect
 import numpy
 import lmfit
+import operator
 import scipy.interpolate
 
 from typing import Callable
-from scipy.integrate import trapz
 
 from lmfit.model import ModelResult
 
-from skipi.util import is_number
+from skipi.util import is_number, njit, prange, HAS_NUMBA
 from skipi.domain import Domain
 
 FUNCTION_INTERPOLATION_TYPE = 'linear'
 
+# Minimal number of points for which linear interpolation is done in parallel (requires numba)
+PARALLEL_INTERPOLATION_SIZE = 10000
+
+
+# Callables for the lazy operators, see Function._combine. The operators are written out, since calling
+# i.e. operator.add costs more than the addition itself when evaluating at a single point.
+_LAZY_OPERATIONS = {
+    operator.add: (lambda f, g: lambda x: f(x) + g(x), lambda f, c: lambda x: f(x) + c),
+    operator.sub: (lambda f, g: lambda x: f(x) - g(x), lambda f, c: lambda x: f(x) - c),
+    operator.mul: (lambda f, g: lambda x: f(x) * g(x), lambda f, c: lambda x: f(x) * c),
+    operator.truediv: (lambda f, g: lambda x: f(x) / g(x), lambda f, c: lambda x: f(x) / c),
+    operator.pow: (lambda f, g: lambda x: f(x) ** g(x), lambda f, c: lambda x: f(x) ** c),
+}
+
 
 class Function(object):
     """
@@ -42,9 +57,23 @@ class Function(object):
     :Example:
     >>> f.plot() # plots f on the whole domain (f.get_domain())
     >>> g.plot(domain, show=True) # plots g on domain
+
+    By default, operations chain the underlying callables (see lazy). Set lazy to False to evaluate the
+    operands on the domain and interpolate the result instead:
+
+    :Example:
+    >>> Function.lazy = False
+    >>> h = (f + g) * f # evaluated and interpolated right away
     """
 
-    def __init__(self, domain: Domain, fun_callable: Callable, dy: 'Function' = None, dx: 'Function' = None):
+    # If False, the arithmetic operators evaluate on the domain and interpolate, see _combine
+    lazy = True
+
+    # Marks Function instances for the type checks on the hot paths, see _is_function
+    _is_skipi_function = True
+
+    def __init__(self, domain: Domain, fun_callable: Callable, dy: 'Function' = None, dx: 'Function' = None,
+                 eager=False):
         """
         Creates a mathematical function based on the given domain and callable object.
 
@@ -61,8 +90,10 @@ class Function(object):
 
         :param domain: list of points where the function is defined, equidistantly spaced!
         :param fun_callable: callable function to evaluate this Function.
+        :param eager: If True, the function is evaluated on the domain right away, otherwise on the first
+        call of eval()
         """
-        if isinstance(domain, Function):
+        if _is_function(domain):
             self._domain = domain.get_dom()
         elif isinstance(domain, Domain):
             self._domain = domain
@@ -72,12 +103,28 @@ class Function(object):
         if not callable(fun_callable):
             raise RuntimeError("function must be callable")
 
-        if isinstance(fun_callable, Function):
+        # Values on the domain, cached by eval(). Subclasses changing their callable have to reset them, see
+        # skipi.parameter.Combine
+        self._y = None
+
+        if _is_function(fun_callable):
+            if fun_callable.get_dom() is self._domain:
+                self._y = fun_callable._y
             fun_callable = fun_callable.get_function()
+        elif isinstance(fun_callable, _LinearInterpolation):
+            # Interpolated from known values, no need to interpolate them again if they are on our domain
+            grid = self.get_domain()
+            if fun_callable.x is grid or numpy.array_equal(fun_callable.x, grid):
+                self._y = fun_callable.y
 
         self._f = fun_callable
         self._dy = dy
         self._dx = dx
+        # None until the first evaluation tells us whether fun_callable accepts arrays
+        self._vectorizable = None
+
+        if eager and self._y is None:
+            self._y = _read_only(self._evaluate(self.get_domain()))
 
     def __reduce__(self):
         dy = self._dy.eval() if self._dy is not None else None
@@ -96,7 +143,12 @@ class Function(object):
         return numpy.any(numpy.iscomplex(self.eval()))
 
     def is_evenly_spaced(self):
-        return True
+        """
+        Checks whether the domain of this function is equidistantly spaced, see is_evenly_spaced_domain.
+
+        :return: bool
+        """
+        return self.is_evenly_spaced_domain(self._domain)
 
     def copy(self):
         """
@@ -172,6 +224,28 @@ class Function(object):
         f = self._f
         return self.__class__(dom, lambda x: f(x - offset), dx=dx, dy=dy)
 
+    def shift_eager(self, offset, domain=False):
+        """
+        Same as shift, however the shifted function is evaluated on the domain right away and interpolated.
+        Thus, the result is only exact on the domain.
+
+        :param offset:
+        :param domain:
+        :return:
+        """
+        dx = self._dx.shift_eager(offset, domain) if self._dx else None
+        dy = self._dy.shift_eager(offset, domain) if self._dy else None
+
+        if domain is True:
+            # f(x - offset) on the shifted domain are just the values on the current domain
+            dom = self._domain.shift(offset)
+            feval = self.eval()
+        else:
+            dom = self._domain
+            feval = evaluate(self.get_domain() - offset, self._f)
+
+        return self.__class__(dom, to_function(dom, feval), dx=dx, dy=dy)
+
     def scale_domain(self, factor):
         """
         Scales the domain by the factor (and the function accordingly)
@@ -205,6 +279,16 @@ class Function(object):
         f = self._f
         return self.__class__(self._domain, lambda x: function(f(x)))
 
+    def apply_eager(self, function: Callable):
+        """
+        Same as apply, however function is applied to the values on the domain right away and the result
+        is interpolated. Thus, the result is only exact on the domain.
+
+        :param function: Callable function
+        :return:
+        """
+        return self.__class__(self._domain, to_function(self._domain, evaluate(self.eval(), function)))
+
     def composeWith(self, function: Callable):
         """
         Composition of two functions, similar to apply. However, the composition is the other way round.
@@ -223,6 +307,17 @@ class Function(object):
         f = self._f
         return self.__class__(self._domain, lambda x: f(function(x)))
 
+    def composeWith_eager(self, function: Callable):
+        """
+        Same as composeWith, however the composition is evaluated on the domain right away and interpolated.
+        Thus, the result is only exact on the domain.
+
+        :param function:
+        :return:
+        """
+        feval = evaluate(evaluate(self.get_domain(), function), self._f)
+        return self.__class__(self._domain, to_function(self._domain, feval))
+
     def flip(self, x0=None):
         """
         "Flips"/"mirrors" the function the function at x0.
@@ -257,28 +352,28 @@ class Function(object):
         Computes the complex conjugate and returns it.
         :return:
         """
-        return self.apply(numpy.conj)
+        return self.apply_eager(numpy.conj)
 
     def abs(self):
         """
         Computes the absolute value and returns it.
         :return:
         """
-        return self.apply(numpy.abs)
+        return self.apply_eager(numpy.abs)
 
     def log(self):
         """
         Computes the natural logarithm and returns it.
         :return:
         """
-        return self.apply(numpy.log)
+        return self.apply_eager(numpy.log)
 
     def log10(self):
         """
         Computes the logarithm (base 10) and returns it.
         :return:
         """
-        return self.apply(numpy.log10)
+        return self.apply_eager(numpy.log10)
 
     def max(self):
         """
@@ -308,6 +403,19 @@ class Function(object):
         """
         return self.get_domain()[numpy.argmin(self.eval())]
 
+    def find_zeros(self):
+        """
+        Finds the zeros of the (real part of the) function by looking for sign changes between neighbouring
+        points in the domain. Points where the function is exactly zero do not count as a sign change.
+
+        For each sign change, the first point after it is returned, so the precision is limited by the
+        spacing of the domain.
+
+        :return: numpy.array
+        """
+        sign = numpy.sign(self.eval().real)
+        return self.get_domain()[1:][sign[:-1] * sign[1:] < 0]
+
     def get_domain(self):
         return self._domain.get()
 
@@ -315,7 +423,28 @@ class Function(object):
         return self._domain
 
     def eval(self):
-        return self(self.get_domain())
+        """
+        Evaluates the function on its domain.
+
+        The result is computed once and cached, hence the returned array is read-only.
+
+        :return: numpy.array
+        """
+        if self._y is None:
+            self._y = _read_only(self._evaluate(self.get_domain()))
+        return self._y
+
+    def _evaluate(self, domain):
+        if self._vectorizable:
+            return numpy.asarray(self._f(domain))
+
+        if self._vectorizable is None:
+            feval = _try_vectorized_eval(self._f, domain)
+            self._vectorizable = feval is not None
+            if feval is not None:
+                return feval
+
+        return numpy.array([self._f(x) for x in domain])
 
     @classmethod
     def get_dx(cls, domain):
@@ -332,6 +461,29 @@ class Function(object):
 
         return Domain.get_dx(domain)
 
+    @classmethod
+    def is_evenly_spaced_domain(cls, domain, rtol=1e-05, atol=1e-08):
+        """
+        Checks whether the points in domain are equidistantly spaced, i.e. whether all differences between
+        neighbouring points are close (see numpy.isclose) to the first one.
+
+        :param domain: numpy.array or Domain
+        :param rtol: relative tolerance
+        :param atol: absolute tolerance
+        :return: bool
+        """
+        domain = Domain.as_array(domain)
+
+        if len(domain) < 3:
+            return True
+
+        if HAS_NUMBA:
+            return _is_evenly_spaced(domain, rtol, atol)
+
+        diff = numpy.diff(domain)
+        # Largest deviation of a spacing from the first one, same criterion as _is_evenly_spaced
+        return bool(max(diff.max() - diff[0], diff[0] - diff.min()) <= atol + rtol * abs(diff[0]))
+
     def get_function(self):
         return self._f
 
@@ -420,47 +572,65 @@ class Function(object):
     def _unknown_type(other):
         raise RuntimeError("Unknown type of other")
 
+    def _combine(self, other, op):
+        """
+        Combines this function with other (Function, callable or number) using the binary operator op.
+
+        If the class attribute lazy is True, the returned callable chains the callables of both operands,
+        i.e. it computes op(f(x), g(x)) on each call. Otherwise both operands are evaluated on the domain
+        right away and the combined values are interpolated, which keeps the call depth constant
+        when many operations are chained, however the result is only exact on the domain.
+
+        :param other: Function, callable or number
+        :param op: binary operator, i.e. operator.add
+        :return: Callable function
+        """
+        if self.lazy:
+            with_callable, with_number = _LAZY_OPERATIONS[op]
+            if _is_function(other):
+                return with_callable(self._f, other.get_function())
+            if callable(other):
+                return with_callable(self._f, other)
+            return with_number(self._f, other)
+
+        if callable(other):
+            other = evaluate(self.get_domain(), other)
+
+        return to_function(self._domain, op(self.eval(), other))
+
     def __add__(self, other):
-        if isinstance(other, Function):
-            return self.__class__(self._domain, lambda x: self._f(x) + other.get_function()(x), dx=self.dx)
         if callable(other):
-            return self.__class__(self._domain, lambda x: self._f(x) + other(x), dx=self.dx)
+            return self.__class__(self._domain, self._combine(other, operator.add), dx=self.dx)
         if is_number(other):
-            return self.__class__(self._domain, lambda x: self._f(x) + other, dx=self.dx, dy=self.dy)
+            return self.__class__(self._domain, self._combine(other, operator.add), dx=self.dx, dy=self.dy)
 
         self._unknown_type(other)
 
     def __sub__(self, other):
-        if isinstance(other, Function):
-            return self.__class__(self._domain, lambda x: self._f(x) - other.get_function()(x), dx=self.dx)
         if callable(other):
-            return self.__class__(self._domain, lambda x: self._f(x) - other(x), dx=self.dx)
+            return self.__class__(self._domain, self._combine(other, operator.sub), dx=self.dx)
         if is_number(other):
-            return self.__class__(self._domain, lambda x: self._f(x) - other, dx=self.dx, dy=self.dy)
+            return self.__class__(self._domain, self._combine(other, operator.sub), dx=self.dx, dy=self.dy)
 
         self._unknown_type(other)
 
     def __pow__(self, power):
         if power == 1:
             return self
-        if isinstance(power, Function):
-            return self.__class__(self._domain, lambda x: self._f(x) ** power.get_function()(x), dx=self.dx)
         if callable(power):
-            return self.__class__(self._domain, lambda x: self._f(x) ** power(x), dx=self.dx)
+            return self.__class__(self._domain, self._combine(power, operator.pow), dx=self.dx)
         if is_number(power):
             dy = power * self._f ** (power - 1) * self._dy if self._dy is not None else None
-            return self.__class__(self._domain, lambda x: self._f(x) ** power, dx=self.dx, dy=dy)
+            return self.__class__(self._domain, self._combine(power, operator.pow), dx=self.dx, dy=dy)
 
         self._unknown_type(power)
 
     def __mul__(self, other):
-        if isinstance(other, Function):
-            return self.__class__(self._domain, lambda x: self._f(x) * other.get_function()(x), dx=self.dx)
         if callable(other):
-            return self.__class__(self._domain, lambda x: self._f(x) * other(x), dx=self.dx)
+            return self.__class__(self._domain, self._combine(other, operator.mul), dx=self.dx)
         if is_number(other):
             dy = self.dy * other if self.dy is not None else None
-            return self.__class__(self._domain, lambda x: self._f(x) * other, dx=self.dx, dy=dy)
+            return self.__class__(self._domain, self._combine(other, operator.mul), dx=self.dx, dy=dy)
 
         self._unknown_type(other)
 
@@ -468,19 +638,22 @@ class Function(object):
         if other == 0:
             raise RuntimeError("Cannot divide by zero")
 
-        if isinstance(other, Function):
-            return self.__class__(self._domain, lambda x: self._f(x) / other.get_function()(x), dx=self.dx)
         if callable(other):
-            return self.__class__(self._domain, lambda x: self._f(x) / other(x), dx=self.dx)
+            return self.__class__(self._domain, self._combine(other, operator.truediv), dx=self.dx)
         if is_number(other):
             dy = self.dy / other if self.dy is not None else None
-            return self.__class__(self._domain, lambda x: self._f(x) / other, dx=self.dx, dy=dy)
+            return self.__class__(self._domain, self._combine(other, operator.truediv), dx=self.dx, dy=dy)
 
         self._unknown_type(other)
 
     def __neg__(self):
-        f = self._f
-        return self.__class__(self._domain, lambda x: -f(x), dy=self.dy, dx=self.dx)
+        if self.lazy:
+            f = self._f
+            fun = lambda x: -f(x)
+        else:
+            fun = to_function(self._domain, -self.eval())
+
+        return self.__class__(self._domain, fun, dy=self.dy, dx=self.dx)
 
     def plot(self, plot_space=None, show=False, real=True, **kwargs):
         import pylab
@@ -488,7 +661,7 @@ class Function(object):
             plot_space = self.get_domain()
 
         plot_function = pylab.plot
-        feval = self._f(plot_space)
+        feval = self.eval() if plot_space is self.get_domain() else self(plot_space)
         dfeval = self._dy.eval() if self._dy is not None else None
 
         lbl_re = {}
@@ -527,11 +700,11 @@ class Function(object):
 
     @property
     def real(self):
-        return self.__class__(self._domain, lambda x: self._f(x).real)
+        return self.apply_eager(numpy.real)
 
     @property
     def imag(self):
-        return self.__class__(self._domain, lambda x: self._f(x).imag)
+        return self.apply_eager(numpy.imag)
 
     @property
     def dy(self):
@@ -629,9 +802,9 @@ class Integral(Function):
         :param C: integral constant (can be arbitrary)
         :return:
         """
-        dx = Domain.get_dx(domain)
+        dx = cls.get_dx(Domain.as_array(domain))
 
-        Feval = scipy.integrate.cumtrapz(y=evaluate(domain, feval), dx=dx, initial=0) + C
+        Feval = _cumtrapz(evaluate(domain, feval), dx) + C
         return Function.to_function(domain, Feval, **kwargs)
 
     @classmethod
@@ -647,10 +820,14 @@ class Integral(Function):
         r"""
         Calculates the definite integral of the Function fun.
 
-        If x0 or x1 are given, the function is re-meshed at these points, and thus this function returns
+        If x0 or x1 are given, the integral is restricted to these points (and the domain), i.e.
         ::math..
             \int_{x_0}^{x_1} f(x) dx
 
+        where f is linearly interpolated at x0 and x1.
+
+        If x1 < x0, the bounds are swapped and the integral is negated.
+
         If x0 and x1 are both None, the integral is evaluated over the whole domain
         x0, x1 = domain[0], domain[-1], i.e.
         ::math..
@@ -661,11 +838,39 @@ class Integral(Function):
         :param x1: upper bound of the integral limit or None
         :return: definite integral value (Not a function!)
         """
-        if not any(numpy.array([x0, x1]) is None):
-            fun = fun.vremesh((x0, x1))
+        domain = fun.get_domain()
+        feval = fun.eval()
+
+        if len(feval) < 2:
+            return 0.0
 
-        dx = Domain.get_dx(fun.get_dom())
-        return scipy.integrate.trapz(fun.eval(), dx=dx)
+        dx = cls.get_dx(domain)
+
+        if x0 is None and x1 is None:
+            # trapezoidal rule on an equidistant grid
+            return dx * (feval.sum() - 0.5 * (feval[0] + feval[-1]))
+
+        if x0 is not None and x1 is not None and x1 < x0:
+            return -cls.integrate(fun, x1, x0)
+
+        x0 = domain[0] if x0 is None else max(x0, domain[0])
+        x1 = domain[-1] if x1 is None else min(x1, domain[-1])
+
+        if x1 <= x0:
+            # empty interval after restricting it to the domain
+            return 0.0
+
+        f0, f1 = numpy.interp([x0, x1], domain, feval)
+
+        # grid points strictly inside (x0, x1)
+        i0 = numpy.searchsorted(domain, x0, side='right')
+        i1 = numpy.searchsorted(domain, x1, side='left') - 1
+
+        if i1 < i0:
+            return (x1 - x0) * 0.5 * (f0 + f1)
+
+        inner = dx * (feval[i0:i1 + 1].sum() - 0.5 * (feval[i0] + feval[i1]))
+        return inner + (domain[i0] - x0) * 0.5 * (f0 + feval[i0]) + (x1 - domain[i1]) * 0.5 * (feval[i1] + f1)
 
 
 # Just renaming
@@ -677,7 +882,15 @@ class Derivative(Function):
     @classmethod
     def to_function(cls, domain, feval, **kwargs):
         feval = evaluate(domain, feval)
-        fprime = numpy.gradient(feval, Domain.get_dx(domain), edge_order=2)
+        dx = cls.get_dx(Domain.as_array(domain))
+
+        if HAS_NUMBA and feval.ndim == 1 and len(feval) >= 3:
+            feval = feval.astype(numpy.result_type(feval, float), copy=False)
+            fprime = numpy.empty_like(feval)
+            _gradient(feval, dx, fprime)
+        else:
+            fprime = numpy.gradient(feval, dx, edge_order=2)
+
         return Function.to_function(domain, fprime, **kwargs)
 
     @classmethod
@@ -753,11 +966,38 @@ class FittedFunction(Function):
         return cls(f.get_dom(), fitted_function, dx=f.dx, dy=f.dy, fit=fit_result)
 
 
+def _is_function(obj):
+    """
+    Same as isinstance(obj, Function), using the class attribute _is_skipi_function instead of walking
+    the class hierarchy.
+
+    :param obj:
+    :return: bool
+    """
+    return getattr(obj, '_is_skipi_function', False)
+
+
+def _read_only(values):
+    """
+    Returns a read-only view of values. The flags of values itself are left untouched, since it might be
+    owned by the caller.
+
+    :param values: numpy.array
+    :return: numpy.array
+    """
+    if not values.flags.writeable:
+        return values
+    values = values.view()
+    values.setflags(write=False)
+    return values
+
+
 def evaluate(domain, function):
     """
     Evaluates a function on its domain.
 
     If function is callable, it's simply evaluated using the callable
+    If function is a Function defined on the same domain, its cached values are returned
     If function is a numpy array, then its simply returned (assuming it was already evaluated elsewhere)
 
 
@@ -766,14 +1006,17 @@ def evaluate(domain, function):
     :raise RuntimeError: Unknown type of function given
     :return:
     """
+    if _is_function(function) and (domain is function.get_dom() or domain is function.get_domain()):
+        return function.eval()
+
     if isinstance(domain, Domain):
         domain = domain.get()
 
     if callable(function):
-        try:
-            return numpy.array(function(domain))
-        except:
-            return numpy.array([function(x) for x in domain])
+        feval = _try_vectorized_eval(function, domain)
+        if feval is None:
+            feval = numpy.array([function(x) for x in domain])
+        return feval
     elif isinstance(function, numpy.ndarray) and len(domain) == len(function):
         return function
     elif isinstance(function, list) and len(domain) == len(function):
@@ -782,6 +1025,97 @@ def evaluate(domain, function):
         raise RuntimeError("Cannot evaluate, unknown type")
 
 
+@njit(cache=True)
+def _is_evenly_spaced(domain, rtol, atol):
+    dx0 = domain[1] - domain[0]
+    tol = atol + rtol * abs(dx0)
+    for i in range(2, domain.shape[0]):
+        # Negated, such that NaN is rejected like in the numpy path
+        if not abs((domain[i] - domain[i - 1]) - dx0) <= tol:
+            return False
+    return True
+
+
+@njit(parallel=True, cache=True)
+def _gradient(f, dx, out):
+    # Same as numpy.gradient(f, dx, edge_order=2), in a single pass
+    n = f.shape[0]
+    for i in prange(1, n - 1):
+        out[i] = (f[i + 1] - f[i - 1]) / (2 * dx)
+    out[0] = (-3 * f[0] + 4 * f[1] - f[2]) / (2 * dx)
+    out[n - 1] = (3 * f[n - 1] - 4 * f[n - 2] + f[n - 3]) / (2 * dx)
+
+
+@njit(parallel=True, cache=True)
+def _interpolate_linear(t, x, y, fill, out):
+    # Same as numpy.interp(t, x, y, left=fill, right=fill) for real y. The points are processed in chunks in
+    # parallel. Like numpy, the interval of the previous point is tried before a binary search, which makes
+    # sorted points (i.e. a mesh) cheap.
+    n = x.shape[0]
+    m = t.shape[0]
+    chunk = 4096
+    for c in prange((m + chunk - 1) // chunk):
+        j = 0
+        for k in range(c * chunk, min((c + 1) * chunk, m)):
+            tk = t[k]
+            if tk < x[0] or tk > x[n - 1]:
+                out[k] = fill
+                continue
+            if tk != tk:
+                out[k] = tk
+                continue
+
+            if not (j < n - 1 and x[j] <= tk < x[j + 1]):
+                if j + 2 < n and x[j + 1] <= tk < x[j + 2]:
+                    j += 1
+                else:
+                    j = numpy.searchsorted(x, tk, side='right') - 1
+
+            if j >= n - 1 or x[j] == tk:
+                out[k] = y[j]
+            else:
+                out[k] = (y[j + 1] - y[j]) / (x[j + 1] - x[j]) * (tk - x[j]) + y[j]
+
+
+def _cumtrapz(y, dx):
+    """
+    Cumulative trapezoidal integration of y on an equidistant grid with spacing dx, starting at 0.
+
+    Same as scipy.integrate.cumtrapz(y, dx=dx, initial=0), but the cumulative sum is written into the result
+    directly instead of concatenating it with the initial value afterwards.
+
+    :param y: numpy.array
+    :param dx: spacing
+    :return: numpy.array
+    """
+    F = numpy.zeros(y.shape, dtype=numpy.result_type(y, float))
+    numpy.cumsum((y[:-1] + y[1:]) * (0.5 * dx), out=F[1:])
+    return F
+
+
+def _try_vectorized_eval(function, domain):
+    """
+    Evaluates function on the whole domain with a single call.
+
+    Returns None if the callable does not accept arrays or if its result does not have the shape of the
+    domain (i.e. it is not vectorized), in which case the caller has to evaluate it point by point.
+
+    :param function: callable
+    :param domain: numpy.array
+    :return: numpy.array or None
+    """
+    domain = numpy.asarray(domain)
+    try:
+        feval = numpy.asarray(function(domain))
+    except Exception:
+        return None
+
+    if not feval.shape == domain.shape:
+        return None
+
+    return feval
+
+
 def set_interpolation_type(interpolation_type):
     """
     Sets the interpolation type used for all Functions
@@ -795,6 +1129,87 @@ def set_interpolation_type(interpolation_type):
     return previous_type
 
 
+class _LinearInterpolation(object):
+    """
+    Linear interpolation of the values y at the increasing points x, evaluating to fill outside of the
+    interval [x[0], x[-1]]. Same as numpy.interp(t, x, y, left=fill, right=fill).
+
+    For real values, scalars are looked up with bisect in list copies of x and y (created on the first
+    scalar call), which is considerably faster than calling numpy for a single point.
+    """
+    __slots__ = ('x', 'y', 'fill', '_is_real', '_xl', '_yl')
+
+    def __init__(self, x, y, fill=0):
+        self.x = x
+        # Read-only, since Function uses y as its values on the domain, see Function.eval
+        self.y = _read_only(numpy.asarray(y, dtype=numpy.result_type(y, float)))
+        self.fill = fill
+        self._is_real = not numpy.iscomplexobj(self.y)
+        self._xl = None
+        self._yl = None
+
+    def __call__(self, t):
+        if self._is_real and isinstance(t, (int, float)):
+            return numpy.float64(self._interpolate_scalar(t))
+
+        return numpy.interp(t, self.x, self.y, left=self.fill, right=self.fill)
+
+    def evaluate_parallel(self, t):
+        """
+        Same as calling it with the array t, however the points are distributed over multiple threads if
+        numba is available and the values are real.
+
+        :param t: numpy.array
+        :return: numpy.array
+        """
+        if not HAS_NUMBA or not self._is_real:
+            return self(t)
+
+        t = numpy.asarray(t, dtype=float)
+        out = numpy.empty(t.shape, dtype=self.y.dtype)
+        _interpolate_linear(t.ravel(), self.x, self.y, self.fill, out.ravel())
+        return out
+
+    def _interpolate_scalar(self, t):
+        if self._xl is None:
+            self._xl, self._yl = self.x.tolist(), self.y.tolist()
+
+        xl, yl = self._xl, self._yl
+
+        if t < xl[0] or t > xl[-1]:
+            return self.fill
+        if t != t:
+            return t
+
+        j = bisect.bisect_right(xl, t) - 1
+        if j >= len(xl) - 1 or xl[j] == t:
+            return yl[j]
+
+        x0, y0 = xl[j], yl[j]
+        return (yl[j + 1] - y0) / (xl[j + 1] - x0) * (t - x0) + y0
+
+
+# Interpolation types which are evaluated by a scipy BSpline, and their spline order
+_SPLINE_ORDERS = {'quadratic': 2, 'cubic': 3}
+
+
+class _SplineInterpolation(object):
+    """
+    Evaluates a scipy spline inside its interval [x[0], x[-1]] and to fill outside of it.
+    """
+    __slots__ = ('spline', 'fill', '_xmin', '_xmax')
+
+    def __init__(self, spline, fill=0):
+        self.spline = spline
+        self.fill = fill
+        k = spline.k
+        self._xmin, self._xmax = spline.t[k], spline.t[-k - 1]
+
+    def __call__(self, t):
+        t = numpy.asarray(t)
+        return numpy.where((t < self._xmin) | (t > self._xmax), self.fill, self.spline(t))
+
+
 def to_function(x_space, feval, interpolation=None, to_zero=True):
     """
     Returns an interpolated function using x and f(x).
@@ -811,16 +1226,42 @@ def to_function(x_space, feval, interpolation=None, to_zero=True):
 
     x_space = Domain.as_array(x_space)
 
-    if callable(feval):
-        if isinstance(feval(x_space[0]), numpy.ndarray):
-            feval = feval(x_space)
-        else:
-            feval = numpy.array([feval(x) for x in x_space])
-
     if len(x_space) == 0:
         return lambda x: 0
 
-    feval = numpy.array(feval)
+    if isinstance(feval, _LinearInterpolation) and len(x_space) >= PARALLEL_INTERPOLATION_SIZE:
+        feval = feval.evaluate_parallel(x_space)
+    elif callable(feval):
+        feval = evaluate(x_space, feval)
+    else:
+        # Copy, since the given values might be modified later on
+        feval = numpy.array(feval)
+
+    # Purely real data only needs a single (real) interpolation
+    if numpy.iscomplexobj(feval) and not numpy.any(feval.imag):
+        feval = feval.real
+
+    if interpolation == 'linear' and feval.ndim == 1:
+        # numpy.interp needs increasing x values, interp1d sorts them on its own
+        if numpy.any(x_space[1:] < x_space[:-1]):
+            order = numpy.argsort(x_space)
+            x_space, feval = x_space[order], feval[order]
+        elif x_space.flags.writeable:
+            # The grid of a Domain is read-only and can be shared, any other array is copied like feval
+            x_space = numpy.array(x_space)
+
+        return _LinearInterpolation(x_space, feval, 0 if to_zero else numpy.nan)
+
+    if interpolation in _SPLINE_ORDERS and feval.ndim == 1 and numpy.all(numpy.isfinite(feval)):
+        # interp1d builds the same spline, but wraps every evaluation into its own (slower) dispatch
+        order = numpy.argsort(x_space)
+        spline = scipy.interpolate.make_interp_spline(x_space[order], feval[order],
+                                                      k=_SPLINE_ORDERS[interpolation])
+        if not to_zero:
+            spline.extrapolate = False
+            return spline
+
+        return _SplineInterpolation(spline, 0)
 
     if to_zero:
         fill = (0, 0)
@@ -830,7 +1271,7 @@ def to_function(x_space, feval, interpolation=None, to_zero=True):
     real = scipy.interpolate.interp1d(x_space, feval.real, fill_value=fill, bounds_error=False,
                                       kind=interpolation)
 
-    if numpy.any(numpy.iscomplex(feval)):
+    if numpy.iscomplexobj(feval):
         imag = scipy.interpolate.interp1d(x_space, feval.imag, fill_value=fill, bounds_error=False,
                                           kind=interpolation)
 
@@ -949,7 +1390,8 @@ class AutomorphDecorator(object):
         self._f = f
         # Methods that change the internal function
         self.morph_methods = ['reparametrize', 'transform', 'reinterpolate', 'shift', 'scale_domain', 'apply',
-                              'composeWith', 'vremesh', 'oversample', 'remesh', 'log10', 'log', 'abs', 'conj']
+                              'composeWith', 'vremesh', 'oversample', 'remesh', 'log10', 'log', 'abs', 'conj',
+                              'shift_eager', 'apply_eager', 'composeWith_eager']
 
     def __getattr__(self, method):
         if method in self.morph_methods:
@@ -1,15 +1,83 @@
+import ast
+import copy
 import numpy
 
+from collections import OrderedDict
+from collections.abc import Mapping
 from typing import List, Callable, Any
 
 from skipi.function import Function
 from skipi.domain import Domain
 
 
+class _MemoizedFactory(object):
+    """
+    Wraps a factory (a callable accepting only the parameters) and remembers its results for the most
+    recently used parameters.
+
+    Only lists, tuples and arrays of real numbers are cached. The key holds the values as floats together
+    with the dtype of the given parameters, hence [1], [1.0] and [True] are cached separately. All other
+    parameters (mappings like lmfit.Parameters, scalars, complex or ragged sequences) are passed through to
+    the factory without caching.
+
+    On a cache miss, the factory gets a private copy of the parameters, since the created function usually
+    refers to them and the caller might change them in-place later on (e.g. the buffer of an optimizer).
+    """
+
+    def __init__(self, factory: Callable, maxsize=128):
+        self._factory = factory
+        self._maxsize = maxsize
+        self._cache = OrderedDict()
+
+    @classmethod
+    def wrap(cls, factory: Callable):
+        if isinstance(factory, cls):
+            return factory
+        return cls(factory)
+
+    def __call__(self, params):
+        key = self._key(params)
+        if key is None:
+            return self._factory(params)
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        value = self._factory(self._copy(params))
+        self._cache[key] = value
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+        return value
+
+    @staticmethod
+    def _key(params):
+        if not isinstance(params, (numpy.ndarray, list, tuple)):
+            return None
+
+        try:
+            values = numpy.asarray(params, dtype=float)
+        except (TypeError, ValueError):
+            return None
+
+        dtype = numpy.asarray(params).dtype
+        if values.ndim == 0 or dtype.kind not in 'biuf':
+            return None
+
+        return dtype.str, values.shape, values.tobytes()
+
+    @staticmethod
+    def _copy(params):
+        if isinstance(params, numpy.ndarray):
+            return numpy.array(params)
+        return copy.deepcopy(params)
+
+
 class ParametrizedFunction(Function):
 
     def __init__(self, domain, parametrized_function_callable: Callable[[Any], Callable[[Any], Any]],
-                 parameter_names: List[str], parameters: List[Any]):
+                 parameter_names: List[str], parameters: List[Any], expression: str = None):
         """
         Creates a parametrized function.
 
@@ -40,33 +108,49 @@ class ParametrizedFunction(Function):
         :param parametrized_function_callable: callable which creates a function given parameters
         :param parameter_names: a list containing the parameters
         :param parameters: a list of the parameters for the first initialization
+        :param expression: optional expression in x and the parameter names, equivalent to the function
+        created by parametrized_function_callable, see freeze
         """
-        if not callable(domain):
-            if not isinstance(domain, numpy.ndarray):
+        if callable(domain):
+            self._const_dom = None
+            self._dom_factory = _MemoizedFactory.wrap(domain)
+        else:
+            # The domain does not depend on the parameters, so there is no need to call a factory
+            if not isinstance(domain, (numpy.ndarray, Domain)):
                 domain = numpy.array(domain)
-            domain = lambda x: domain
-
-        self._dom_factory = domain
+            const_dom = Domain.from_domain(domain)
+            self._const_dom = const_dom
+            self._dom_factory = lambda params: const_dom.get()
 
         if not callable(parametrized_function_callable):
             raise RuntimeError("function must be callable")
 
-        self._dom_factory = domain
-        self._f_factory = parametrized_function_callable
+        self._f_factory = _MemoizedFactory.wrap(parametrized_function_callable)
 
         if not len(parameter_names) == len(parameters):
             raise RuntimeError("Number of given parameters does not match the expected number")
 
         self._param_names = parameter_names
         self._params = parameters
+        self._expression = expression
+
+        if self._const_dom is not None:
+            dom = self._const_dom
+        else:
+            dom = self._dom_factory(parameters)
 
-        dom = self._dom_factory(parameters)
         f = self._f_factory(parameters)
 
         super(ParametrizedFunction, self).__init__(dom, f)
 
+    def _get_domain_argument(self):
+        if self._const_dom is not None:
+            return self._const_dom
+        return self._dom_factory
+
     def copy(self):
-        return ParametrizedFunction(self._dom_factory, self._f_factory, self._param_names, self._params)
+        return ParametrizedFunction(self._get_domain_argument(), self._f_factory, self._param_names,
+                                    self._params, self._expression)
 
     def reparametrize(self, params):
         """
@@ -75,7 +159,31 @@ class ParametrizedFunction(Function):
         :param params:  a list of the parameters
         :return:
         """
-        return ParametrizedFunction(self._dom_factory, self._f_factory, self._param_names, params)
+        return ParametrizedFunction(self._get_domain_argument(), self._f_factory, self._param_names, params,
+                                    self._expression)
+
+    def freeze(self, expression: str = None):
+        """
+        Returns a normal function with the current parameters fixed.
+
+        If an expression is given (here or in the constructor), it is compiled into a function of x with the
+        current parameter values inserted as constants, which avoids looking them up on every call.
+        Otherwise, the function created by the factory is used.
+
+        :Example:
+        >>> f = ParametrizedFunction(grid, lambda p: lambda x: p[0] * numpy.exp(-x / p[1]), ["A", "tau"], [1, 2])
+        >>> g = f.freeze("A * numpy.exp(-x / tau)") # == lambda x: 1 * numpy.exp(-x / 2)
+
+        :param expression: expression in x and the parameter names, may use numpy
+        :return: Function
+        """
+        if expression is None:
+            expression = self._expression
+
+        if expression is None:
+            return Function(self.get_dom(), self.get_function())
+
+        return Function(self.get_dom(), _compile_expression(expression, self.get_params_dict()))
 
     def get_params(self):
         """
@@ -97,8 +205,13 @@ class ParametrizedFunction(Function):
         """
         Returns a dictionary containing the parameter names as keys, and the parameter values as its values
 
+        If the parameters are a mapping themselves (e.g. lmfit.Parameters), the values are looked up by name.
+
         :return:
         """
+        if isinstance(self._params, Mapping):
+            return {name: getattr(self._params[name], 'value', self._params[name]) for name in self._param_names}
+
         return dict(zip(self._param_names, self._params))
 
     def get_domain_factory(self):
@@ -118,6 +231,50 @@ class ParametrizedFunction(Function):
         return self._f_factory
 
 
+class _InsertConstants(ast.NodeTransformer):
+    def __init__(self, constants: dict):
+        self._constants = constants
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load) and node.id in self._constants:
+            return ast.copy_location(ast.Constant(value=self._constants[node.id]), node)
+        return node
+
+
+# Names which are bound inside compiled expressions, hence cannot be used as parameter names
+_RESERVED_NAMES = ('x', 'numpy', 'np')
+
+
+def _compile_expression(expression: str, params: dict):
+    """
+    Compiles expression into a function of x. Scalar parameters are inserted into the code as constants,
+    all others are looked up by name.
+
+    :param expression: expression in x and the keys of params
+    :param params: dictionary of parameter names and values
+    :raise RuntimeError: A parameter is named like the variable x or the numpy module
+    :return: Callable function
+    """
+    reserved = set(params).intersection(_RESERVED_NAMES)
+    if reserved:
+        raise RuntimeError("Parameter names {} are reserved in expressions".format(sorted(reserved)))
+
+    constants, names = {}, {}
+    for name, value in params.items():
+        value = numpy.asarray(value)
+        if value.ndim == 0 and value.dtype.kind in 'biufc':
+            constants[name] = value.item()
+        else:
+            names[name] = value
+
+    tree = ast.parse("lambda x: " + expression, mode='eval')
+    tree = ast.fix_missing_locations(_InsertConstants(constants).visit(tree))
+
+    scope = {'numpy': numpy, 'np': numpy}
+    scope.update(names)
+    return eval(compile(tree, '<skipi expression>', 'eval'), scope)
+
+
 class Combine(Function):
     def __init__(self, domain, functions: List[Callable], operator: Callable):
 
@@ -149,13 +306,16 @@ class Combine(Function):
             del self[item]
         else:
             self._fs[item] = value
+            self._reset()
 
     def __delitem__(self, key):
         del self._fs[key]
+        self._reset()
 
     def __or__(self, other):
         if isinstance(other, Function):
             self._fs.append(other)
+            self._reset()
         else:
             raise RuntimeError("Unknown type of other")
 
@@ -166,6 +326,12 @@ class Combine(Function):
             self._fs.extend(others)
         else:
             self._fs.append(others)
+        self._reset()
+
+    def _reset(self):
+        # The functions changed, hence the cached values of eval() are outdated
+        self._y = None
+        self._vectorizable = None
 
 
 Gaussian = ParametrizedFunction(lambda p: numpy.linspace(p[0] - 5 * p[1], p[0] + 5 * p[1], 2000),
@@ -1,6 +1,22 @@
+import numbers
 import numpy
 import time
 
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    # numba is optional. The kernels are still defined (as plain python functions), but callers should
+    # check HAS_NUMBA and prefer a numpy implementation if it is not available.
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 global _bm_before, _bm_after, _debug
 
 _bm_before = 0
@@ -95,8 +111,14 @@ def vslice(iterable, *selectors, dstart=0, dstop=0):
     return numpy.concatenate([iterable[_vslice(iterable, s, dstart=dstart, dstop=dstop)] for s in selectors])
 
 
+_NUMERIC_TYPES = frozenset({int, float, complex, numpy.int32, numpy.int64, numpy.float32, numpy.float64,
+                            numpy.complex64, numpy.complex128})
+
+
 def is_number(other):
-    return (isinstance(other, int) or
-            isinstance(other, float) or
-            isinstance(other, complex) or
-            (isinstance(other, numpy.ndarray) and other.size == 1))
+    # Exact type lookup first, since this is called for every arithmetic operation
+    if type(other) in _NUMERIC_TYPES:
+        return True
+    if isinstance(other, numpy.ndarray):
+        return other.size == 1
+    return isinstance(other, numbers.Number)
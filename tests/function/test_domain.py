@@ -1,4 +1,6 @@
 import numpy as np
+import pytest
+import skipi.function
 from skipi.function import Function, Derivative
 from ..helper import assert_equal
 
@@ -7,4 +9,20 @@ def test_scale_domain():
     f = Function.to_function(x_domain, lambda x: x**2)
     f_ref = Function(np.linspace(0, 10, 100), lambda x: x**2/100)
 
-    assert_equal(f.scale_domain(10), f_ref)
\ No newline at end of file
+    assert_equal(f.scale_domain(10), f_ref)
+
+
+@pytest.mark.parametrize("has_numba", [True, False])
+def test_evenly_spaced_domain(monkeypatch, has_numba):
+    monkeypatch.setattr(skipi.function, 'HAS_NUMBA', has_numba)
+
+    assert Function.is_evenly_spaced_domain(np.linspace(-3, 7, 1000))
+    assert Function.is_evenly_spaced_domain(np.array([0.0, 1.0]))
+    assert not Function.is_evenly_spaced_domain(np.linspace(0, 1, 100) ** 2)
+    assert not Function.is_evenly_spaced_domain(np.array([0.0, 1.0, np.nan, 3.0]))
+    assert not Function.is_evenly_spaced_domain(np.array([np.nan, 1.0, 2.0]))
+
+
+def test_function_is_evenly_spaced():
+    assert Function(np.linspace(0, 1, 100), lambda x: x).is_evenly_spaced()
+    assert Function.to_function(np.linspace(-5, 5, 7), np.arange(7.0)).is_evenly_spaced()
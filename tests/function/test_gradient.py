@@ -1,16 +1,24 @@
 import numpy as np
+import pytest
+import skipi.function
 from skipi.function import Function, Derivative
 from ..helper import assert_equal
 
 
-def test_derivative_linear_function():
+@pytest.mark.parametrize("has_numba", [True, False])
+def test_derivative_linear_function(monkeypatch, has_numba):
+    monkeypatch.setattr(skipi.function, 'HAS_NUMBA', has_numba)
+
     x_domain = np.linspace(0, 10, 100)
     f = Function(x_domain, lambda x: 5 * x)
     df = Derivative.to_function(x_domain, f)
     assert_equal(df, Function(x_domain, lambda x: 5))
 
 
-def test_derivative_sin():
+@pytest.mark.parametrize("has_numba", [True, False])
+def test_derivative_sin(monkeypatch, has_numba):
+    monkeypatch.setattr(skipi.function, 'HAS_NUMBA', has_numba)
+
     x_domain = np.linspace(0, 1, 10000)
     f = Function(x_domain, lambda x: np.sin(x))
     df = Derivative.to_function(x_domain, f)
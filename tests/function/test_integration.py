@@ -1,5 +1,5 @@
 import numpy as np
-from skipi.function import Function, Integral
+from skipi.function import Function, Integral, Derivative
 
 from ..helper import assert_equal, randspace
 
@@ -63,3 +63,22 @@ def test_strechted_exponential():
     F_exact = Function(x_domain, lambda x: -2 * np.exp(-np.sqrt(x)) * (1 + np.sqrt(x)) + 2)
 
     assert_equal(F, F_exact, TOL=1e-6)
+
+
+def test_definite_integral():
+    f = Function(np.linspace(0, 10, 1001), lambda x: 6 * x)
+
+    assert abs(Integral.integrate(f) - 300) <= 1e-10
+    assert abs(Integral.integrate(f, 0, 5) - 75) <= 1e-10
+    assert abs(Integral.integrate(f, 2.55, 2.57) - 0.3072) <= 1e-10
+    assert abs(Integral.integrate(f, None, 1.005) - 3.030075) <= 1e-10
+    assert abs(Integral.integrate(f, 5, 0) + 75) <= 1e-10
+    assert abs(Integral.integrate(f, 2.57, 2.55) + 0.3072) <= 1e-10
+
+
+def test_integral_on_domain_object():
+    f = Function(np.linspace(0, 1, 11), lambda x: 2 * x)
+
+    assert abs(Integral.integrate(f) - 1) <= 1e-10
+    assert abs(Integral.to_function(f.get_dom(), f).eval()[-1] - 1) <= 1e-10
+    assert_equal(Derivative.from_function(f), Function(f.get_domain(), lambda x: 2))
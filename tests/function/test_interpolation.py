@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from skipi.function import Function
+
+
+def test_scalar_and_array_evaluation_agree():
+    x_domain = np.linspace(0, 10, 57)
+    f = Function.to_function(x_domain, np.sin(x_domain))
+    x = np.concatenate((np.linspace(-1, 11, 1000), x_domain))
+
+    feval = f(x)
+    for xi, fi in zip(x, feval):
+        assert f(float(xi)) == fi
+
+
+def test_interpolated_values_are_read_only():
+    x_domain = np.linspace(0, 1, 101)
+    f = Function.to_function(x_domain, x_domain ** 2)
+
+    with pytest.raises(ValueError):
+        f.eval()[:] = 0
+
+    assert f(0.5) == 0.25
+    assert f.max() == 1.0
+
+
+def test_remesh_large_mesh():
+    x_domain = np.linspace(0, 10, 1001)
+    f = Function.to_function(x_domain, np.sin(x_domain))
+    mesh = np.linspace(-1, 11, 100000)
+
+    g = f.remesh(mesh, reevaluate=True)
+
+    assert np.all(g.eval() == np.interp(mesh, x_domain, np.sin(x_domain), left=0, right=0))
+
+
+def test_cubic_interpolation():
+    x_domain = np.linspace(0, 10, 101)
+    f = Function.to_function(x_domain, np.sin(x_domain), interpolation='cubic')
+    x = np.linspace(0, 10, 1000)
+
+    assert np.all(abs(f(x) - np.sin(x)) <= 1e-5)
+    assert f(-1) == 0 and f(11) == 0
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from skipi.function import Function
 
 from ..helper import assert_equal
@@ -85,4 +86,28 @@ def test_power_with_function():
     f4 = Function(np.linspace(0, 10, 100), lambda x: 0.5**x)
 
     assert_equal(f1**f2, f3)
-    assert_equal(f2**f3, f4)
\ No newline at end of file
+    assert_equal(f2**f3, f4)
+
+
+def test_eager_operations():
+    f1 = Function(np.linspace(1, 11, 100), lambda x: 4 * x ** 2)
+    f2 = Function(np.linspace(1, 11, 100), lambda x: 2 * x)
+    f3 = Function(np.linspace(1, 11, 100), lambda x: -4 * x ** 2 + x + 1)
+
+    Function.lazy = False
+    try:
+        f = -(f1 / f2) ** 2 + f2 * 0.5 + 1
+    finally:
+        Function.lazy = True
+
+    assert_equal(f, f3)
+
+
+def test_eval_is_read_only():
+    x = np.linspace(0, 10, 100)
+    g = Function(x, np.sin)
+
+    with pytest.raises(ValueError):
+        g.eval()[:] = 7
+
+    assert_equal(g, Function(x, np.sin))
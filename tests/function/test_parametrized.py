@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from skipi.function import Function
+from skipi.parameter import ParametrizedFunction, Combine
+
+from ..helper import assert_equal
+
+
+def test_reparametrize_with_constant_domain():
+    calls = []
+
+    def factory(p):
+        calls.append(p)
+        return lambda x: p[0] * x + p[1]
+
+    f = ParametrizedFunction(np.linspace(0, 10, 100), factory, ["a", "b"], [1.0, 0.0])
+    g = f.reparametrize([2.0, 1.0]).reparametrize([1.0, 0.0])
+
+    assert len(calls) == 2
+    assert np.all(g.get_domain() == f.get_domain())
+    assert_equal(g, Function(f.get_domain(), lambda x: x))
+
+
+def test_reparametrize_with_dict():
+    f = ParametrizedFunction(np.linspace(0, 10, 100), lambda p: lambda x: p["a"] * x, ["a"], {"a": 1.0})
+    g = f.reparametrize({"a": 2.0})
+
+    assert_equal(f, Function(f.get_domain(), lambda x: x))
+    assert_equal(g, Function(f.get_domain(), lambda x: 2 * x))
+
+
+def test_reparametrize_distinguishes_parameter_types():
+    calls = []
+
+    def factory(p):
+        calls.append(p)
+        return lambda x: p[0] * x
+
+    f = ParametrizedFunction(np.linspace(0, 10, 100), factory, ["a"], [1])
+    f.reparametrize([1.0]).reparametrize([True]).reparametrize([1.0])
+
+    assert len(calls) == 3
+
+
+def test_reparametrize_after_changing_parameters_in_place():
+    p = np.array([1.0, 0.0])
+    f = ParametrizedFunction(np.linspace(0, 10, 100), lambda p: lambda x: p[0] * x + p[1], ["a", "b"], p)
+
+    p[0] = 5
+    assert f.reparametrize(p)(2.0) == 10.0
+    assert f.reparametrize(np.array([1.0, 0.0]))(2.0) == 2.0
+
+    q = [1.0, 0.0]
+    g = f.reparametrize(q)
+    q[0] = 3
+    assert f.reparametrize(q)(2.0) == 6.0
+    assert g(2.0) == 2.0
+
+
+def test_freeze():
+    f = ParametrizedFunction(np.linspace(0, 10, 100), lambda p: lambda x: p[0] * np.exp(-x / p[1]),
+                             ["A", "tau"], [1.5, 2.0])
+
+    g = f.freeze("A * numpy.exp(-x / tau)")
+
+    assert not isinstance(g, ParametrizedFunction)
+    assert_equal(g, f)
+    assert_equal(f.freeze(), f)
+
+
+def test_freeze_with_dict():
+    f = ParametrizedFunction(np.linspace(0, 10, 100), lambda p: lambda x: p["a"] * x, ["a"], {"a": 2.0})
+
+    assert f.get_params_dict() == {"a": 2.0}
+    assert_equal(f.freeze("a * x"), f)
+
+
+def test_freeze_with_reserved_parameter_name():
+    f = ParametrizedFunction(np.linspace(0, 10, 100), lambda p: lambda x: p[0] * x, ["x"], [2.0])
+
+    with pytest.raises(RuntimeError):
+        f.freeze("x * x")
+
+
+def test_combine_reevaluates_after_change():
+    x_domain = np.linspace(0, 10, 100)
+    a = Function(x_domain, lambda x: x)
+    b = Function(x_domain, lambda x: 2 * x)
+
+    c = Combine(x_domain, [a], np.sum)
+    c.eval()
+    c | b
+
+    assert np.allclose(c.eval(), 3 * x_domain)
+    assert c.max() == 30
+
+    del c[0]
+    assert np.allclose(c.eval(), 2 * x_domain)
@@ -22,3 +22,13 @@ def test_shift_with_domain_shift():
 
     for x in fshifted.get_domain():
         assert abs(fshifted(x) - f(x)) == 0
+
+
+def test_eager_shift():
+    f = Function(np.linspace(0, 10, 100), lambda x: 5 * x)
+    shift = 2
+
+    for g in [f.shift_eager(shift), f.shift_eager(shift, domain=True)]:
+        fshifted = Function(g.get_domain(), lambda x: 5 * (x - shift))
+        for x in g.get_domain():
+            assert abs(fshifted(x) - g(x)) <= 1e-10
@@ -0,0 +1,16 @@
+import numpy as np
+from skipi.function import Function
+
+
+def test_find_zeros():
+    f = Function(np.linspace(0.1, 10, 1000), lambda x: np.sin(x))
+    zeros = f.find_zeros()
+
+    assert len(zeros) == 3
+    assert np.all(abs(zeros - np.array([1, 2, 3]) * np.pi) <= f.get_dx(f.get_domain()))
+
+
+def test_find_zeros_without_sign_change():
+    f = Function(np.linspace(-1, 1, 101), lambda x: x ** 2)
+
+    assert len(f.find_zeros()) == 0